@@ -1,14 +1,21 @@
 import os
+import bisect
 import time
 import socket
+import string
+import itertools
 import threading
 import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
-from flask import Flask, request, render_template_string, redirect, url_for, send_from_directory, abort
-import qrcode
-from PIL import Image, ImageTk
+from flask import Flask, Response, request, redirect, url_for, send_from_directory, abort
+from werkzeug.exceptions import RequestEntityTooLarge
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.parser import ParseFailedException
+from streaming_form_data.targets import FileTarget
 
 import tkinter as tk
 from tkinter import messagebox, ttk
@@ -20,7 +27,10 @@ APP_NAME = "SecurePrint Box"
 BASE_DIR = Path(r"C:\SecurePrintBox")  # change if you want
 JOBS_DIR = BASE_DIR / "Jobs"
 QR_DIR = BASE_DIR / "QR"
+QR_FILE = QR_DIR / "qr.png"
 SERVER_PORT = 8080
+SERVER_THREADS = 8
+SERVER_CONNECTION_LIMIT = 16
 
 # Auto-clean leftover jobs older than this (seconds)
 LEFTOVER_TTL_SECONDS = 30 * 60  # 30 minutes
@@ -28,10 +38,34 @@ LEFTOVER_TTL_SECONDS = 30 * 60  # 30 minutes
 # Max upload size (bytes): 20MB
 MAX_UPLOAD_BYTES = 20 * 1024 * 1024
 
-ALLOWED_EXT = {
+# Read size when streaming an upload request body (bytes): 64KB
+UPLOAD_CHUNK_BYTES = 64 * 1024
+
+# In-progress uploads are written to <job>/.upload_<hex>.part, then renamed
+UPLOAD_TMP_PREFIX = ".upload_"
+UPLOAD_TMP_SUFFIX = ".part"
+
+# Overwrite buffer size used when wiping files (bytes): 1MB
+WIPE_CHUNK_BYTES = 1024 * 1024
+
+# Quick wipe (default): files smaller than this are just unlinked,
+# larger files only get their header overwritten before unlink (bytes): 64KB
+QUICK_WIPE_BYTES = 64 * 1024
+
+# Worker threads used for wiping files / job folders in parallel
+WIPE_WORKERS = 8
+
+ALLOWED_EXT = frozenset({
     ".pdf", ".png", ".jpg", ".jpeg", ".doc", ".docx", ".txt",
     ".ppt", ".pptx", ".xls", ".xlsx"
-}
+})
+
+# Process-local suffix so two jobs started in the same second don't collide
+_JOB_COUNTER = itertools.count()
+
+# safe_filename lookup tables
+_FILENAME_SEP_TRANS = str.maketrans({"\\": "_", "/": "_"})
+_FILENAME_ASCII_OK = frozenset(string.ascii_letters + string.digits + " ._-()")
 
 # =========================
 # Utility functions
@@ -40,95 +74,199 @@ def ensure_dirs():
     JOBS_DIR.mkdir(parents=True, exist_ok=True)
     QR_DIR.mkdir(parents=True, exist_ok=True)
 
+_LOCAL_IP = None
+
 def get_local_ip():
     """
     Get a LAN IP to show in QR. This attempts a UDP connect trick.
+    The result is cached for the lifetime of the process.
     """
+    global _LOCAL_IP
+    if _LOCAL_IP:
+        return _LOCAL_IP
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(0.1)
+            s.connect(("8.8.8.8", 80))
+            _LOCAL_IP = s.getsockname()[0]
+        return _LOCAL_IP
     except Exception:
+        # not cached, so a later call can pick up the network once it's up
         return "127.0.0.1"
 
+def make_qr_image(data: str, size: int = 220):
+    """
+    Build a size x size 1-bit QR image for a short URL.
+    Version and mask are pinned so qrcode skips its fit/mask-pattern search,
+    and box_size is picked so no resize is needed (QR is centered on white).
+    """
+    # imported lazily: only needed once at UI startup, keeps module import fast
+    import qrcode
+    from PIL import Image
+
+    version, border = 3, 2
+    modules = 17 + 4 * version  # 29 for version 3
+    qr = qrcode.QRCode(
+        version=version,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=max(1, size // (modules + 2 * border)),
+        border=border,
+        mask_pattern=0,
+    )
+    qr.add_data(data)
+    qr.make(fit=False)
+    img = qr.make_image(fill_color="black", back_color="white").get_image().convert("1")
+    canvas = Image.new("1", (size, size), 1)
+    canvas.paste(img, ((size - img.width) // 2, (size - img.height) // 2))
+    return canvas
+
 def safe_filename(name: str) -> str:
     # minimal sanitization (avoid weird paths)
-    name = name.replace("\\", "_").replace("/", "_").strip()
+    name = name.translate(_FILENAME_SEP_TRANS).strip()
+    if name.isascii():
+        # common case: C-level filter against a precomputed set
+        return "".join(filter(_FILENAME_ASCII_OK.__contains__, name)).strip()
     return "".join(c for c in name if c.isalnum() or c in " ._-()").strip()
 
 def is_allowed(filename: str) -> bool:
-    ext = Path(filename).suffix.lower()
-    return ext in ALLOWED_EXT
+    # same rule as Path.suffix (a leading dot alone is not an extension), without building a Path
+    i = filename.rfind(".")
+    return i > 0 and filename[i:].lower() in ALLOWED_EXT
 
 def now_job_id():
-    return "JOB_" + datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"JOB_{datetime.now():%Y%m%d_%H%M%S}_{next(_JOB_COUNTER):04d}"
 
 def write_marker(job_path: Path):
     marker = job_path / ".jobmeta"
     marker.write_text(str(int(time.time())), encoding="utf-8")
 
 def read_marker_ts(job_path: Path):
-    marker = job_path / ".jobmeta"
-    if marker.exists():
-        try:
-            return int(marker.read_text(encoding="utf-8").strip())
-        except Exception:
-            return None
-    return None
+    """
+    Job start time recorded by write_marker, or None if missing/unreadable.
+    """
+    try:
+        return int((job_path / ".jobmeta").read_text(encoding="utf-8").strip())
+    except (OSError, ValueError):
+        return None
 
-def basic_secure_delete_file(file_path: Path, passes: int = 1):
+def basic_secure_delete_file(file_path: Path, passes: int = 1, secure: bool = False,
+                             thorough: bool = False, unlink: bool = True):
     """
     Basic overwrite + delete. Good for hackathon MVP.
-    Note: On SSDs, perfect irrecoverability is not guaranteed due to wear leveling.
+    Note: On SSDs, perfect irrecoverability is not guaranteed due to wear leveling,
+    so by default small files are just unlinked and larger ones only get their
+    header overwritten. Pass thorough=True to overwrite the whole file (HDDs),
+    and secure=True to fsync after each pass (much slower).
+    Pass unlink=False to only overwrite, when the caller removes the whole tree.
     """
     try:
-        if not file_path.exists() or not file_path.is_file():
+        if not file_path.is_file():
             return
         size = file_path.stat().st_size
-        if size <= 0:
-            file_path.unlink(missing_ok=True)
+        if size <= 0 or (not thorough and size < QUICK_WIPE_BYTES):
+            if unlink:
+                file_path.unlink(missing_ok=True)
             return
 
-        # overwrite content
+        wipe_size = size if thorough else QUICK_WIPE_BYTES
+
+        # overwrite content in fixed-size chunks (constant memory)
+        buf = bytearray(min(wipe_size, WIPE_CHUNK_BYTES))
+        view = memoryview(buf)
         with open(file_path, "r+b") as f:
             for _ in range(max(1, passes)):
                 f.seek(0)
-                f.write(os.urandom(min(size, 1024 * 1024)))  # write 1MB random chunk
-                # If file > 1MB, overwrite remaining with zeros for speed
-                remaining = size - min(size, 1024 * 1024)
-                if remaining > 0:
-                    f.write(b"\x00" * remaining)
+                for offset in range(0, wipe_size, len(buf)):
+                    n = min(len(buf), wipe_size - offset)
+                    buf[:n] = os.urandom(n)
+                    f.write(view[:n])
                 f.flush()
-                os.fsync(f.fileno())
-
-        file_path.unlink(missing_ok=True)
+                if secure:
+                    os.fsync(f.fileno())
+            if wipe_size < size:
+                # drop the un-overwritten tail in one call instead of writing zeros
+                # (f.truncate maps to SetEndOfFile on Windows)
+                f.truncate(wipe_size)
+
+        if unlink:
+            file_path.unlink(missing_ok=True)
     except Exception:
         # If something is locked, we still try to delete later
+        if not unlink:
+            return
         try:
             file_path.unlink(missing_ok=True)
         except Exception:
             pass
 
-def wipe_job_folder(job_path: Path):
+def iter_files(folder):
+    """
+    Recursively yield file paths under folder using os.scandir
+    (file type comes from the directory entry, no extra stat per file).
+    """
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_files(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
+    except OSError:
+        return
+
+def wipe_job_folder(job_path: Path, files=None):
     """
     Securely delete files inside job folder and remove folder.
+    Files are overwritten in one pass, then rmtree unlinks everything in bulk.
+    If the caller already knows the job's files, pass them to skip the folder scan.
     """
     if not job_path.exists():
         return
 
-    # delete files first
-    for p in job_path.rglob("*"):
-        if p.is_file():
-            basic_secure_delete_file(p, passes=1)
+    # overwrite files first
+    if files is None:
+        files = list(iter_files(job_path))
+    overwrite_files(files)
+
+    remove_job_folder(job_path)
+
+def wipe_job_folders(job_paths):
+    """
+    Wipe several job folders: one shared pool overwrites all their files,
+    then each folder is removed.
+    """
+    files = [p for job_path in job_paths for p in iter_files(job_path)]
+    overwrite_files(files)
+    for job_path in job_paths:
+        remove_job_folder(job_path)
+
+def overwrite_files(files):
+    """
+    Overwrite files in parallel (I/O bound, so threads run in parallel) without
+    unlinking them; remove_job_folder deletes them in bulk afterwards.
+    """
+    if not files:
+        return
+    with ThreadPoolExecutor(max_workers=WIPE_WORKERS) as ex:
+        list(ex.map(lambda p: basic_secure_delete_file(p, passes=1, unlink=False), files))
 
-    # remove remaining structure
+def remove_job_folder(job_path: Path):
+    # remove files and remaining structure
     try:
         shutil.rmtree(job_path, ignore_errors=True)
     except Exception:
         pass
 
+def wipe_all_jobs():
+    """
+    Wipe every job folder (emergency clean).
+    """
+    if not JOBS_DIR.exists():
+        return
+    with os.scandir(JOBS_DIR) as it:
+        jobs = [Path(e.path) for e in it if e.is_dir(follow_symlinks=False)]
+    wipe_job_folders(jobs)
+
 def cleanup_leftover_jobs():
     """
     Zero-trust cleanup: wipes job folders older than TTL.
@@ -136,20 +274,20 @@ def cleanup_leftover_jobs():
     if not JOBS_DIR.exists():
         return 0
 
-    cleaned = 0
+    stale = []
     now_ts = int(time.time())
-    for job_folder in JOBS_DIR.iterdir():
-        if not job_folder.is_dir():
-            continue
-        marker_ts = read_marker_ts(job_folder)
-        if marker_ts is None:
+    with os.scandir(JOBS_DIR) as it:
+        entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+    for entry in entries:
+        started_ts = read_marker_ts(Path(entry.path))
+        if started_ts is None:
             # if marker missing, treat as leftover
-            marker_ts = int(job_folder.stat().st_mtime)
-        age = now_ts - marker_ts
+            started_ts = int(entry.stat().st_mtime)
+        age = now_ts - started_ts
         if age >= LEFTOVER_TTL_SECONDS:
-            wipe_job_folder(job_folder)
-            cleaned += 1
-    return cleaned
+            stale.append(Path(entry.path))
+    wipe_job_folders(stale)
+    return len(stale)
 
 # =========================
 # Flask server (phone upload)
@@ -158,7 +296,25 @@ flask_app = Flask(__name__)
 flask_app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_BYTES
 
 # This will be set by the UI when job starts
-CURRENT_JOB_PATH = {"path": None}
+_current_job_path = None
+
+# Files uploaded into the current job, so wiping doesn't need to re-scan the folder
+_current_job_files = []
+_current_job_files_lock = threading.Lock()
+
+def set_current_job_path(path):
+    # plain module global: request handlers read it without a dict lookup
+    global _current_job_path
+    _current_job_path = path
+
+def take_current_job_files():
+    """
+    Return the files uploaded so far and start a fresh list.
+    """
+    global _current_job_files
+    with _current_job_files_lock:
+        files, _current_job_files = _current_job_files, []
+    return files
 
 UPLOAD_PAGE = """
 <!doctype html>
@@ -196,41 +352,157 @@ UPLOAD_PAGE = """
 </html>
 """
 
+# Compile the page once; GET / without a status message is fully static
+UPLOAD_TEMPLATE = flask_app.jinja_env.from_string(UPLOAD_PAGE)
+INDEX_HTML = {
+    job_active: UPLOAD_TEMPLATE.render(status=None, cls="ok", job_active=job_active)
+    for job_active in (True, False)
+}
+
+def render_upload_page(status: str, cls: str, job_active: bool) -> str:
+    return UPLOAD_TEMPLATE.render(status=status, cls=cls, job_active=job_active)
+
 @flask_app.get("/")
 def index():
-    job_active = CURRENT_JOB_PATH["path"] is not None
-    return render_template_string(UPLOAD_PAGE, status=None, cls="ok", job_active=job_active)
+    job_active = _current_job_path is not None
+    return Response(INDEX_HTML[job_active], mimetype="text/html")
+
+def is_upload_tmp(name: str) -> bool:
+    # .part is never an allowed extension, so this can't match a finished upload
+    return name.startswith(UPLOAD_TMP_PREFIX) and name.endswith(UPLOAD_TMP_SUFFIX)
+
+def claim_upload_path(job_path: Path, name: str) -> Path:
+    """
+    Reserve a free destination name by creating it exclusively, so concurrent
+    uploads of the same name never overwrite each other.
+    """
+    dest = job_path / name
+    stem, ext = dest.stem, dest.suffix
+    ts = int(time.time())
+    for i in itertools.count():
+        try:
+            open(dest, "xb").close()
+            return dest
+        except FileExistsError:
+            # Prevent overwrite collisions
+            suffix = f"_{ts}" if i == 0 else f"_{ts}_{i}"
+            dest = job_path / f"{stem}{suffix}{ext}"
+
+class UploadTarget(FileTarget):
+    """
+    FileTarget that records whether the parser reached the end of the file part
+    (it only closes the file itself in that case).
+    """
+    complete = False
+
+    def on_finish(self):
+        super().on_finish()
+        self.complete = True
+
+def discard_upload(target, tmp_path: Path):
+    # close the temp file (FileTarget keeps it open until finish) and wipe it
+    target.finish()
+    basic_secure_delete_file(tmp_path)
 
 @flask_app.post("/upload")
 def upload():
-    job_path = CURRENT_JOB_PATH["path"]
+    job_path = _current_job_path
     if job_path is None:
-        return render_template_string(UPLOAD_PAGE, status="No active session. Ask operator to Start Job.", cls="warn", job_active=False)
-
-    if "file" not in request.files:
-        return render_template_string(UPLOAD_PAGE, status="No file selected.", cls="warn", job_active=True)
+        return render_upload_page(status="No active session. Ask operator to Start Job.", cls="warn", job_active=False)
 
-    f = request.files["file"]
-    if not f.filename:
-        return render_template_string(UPLOAD_PAGE, status="No file selected.", cls="warn", job_active=True)
+    if request.content_length is not None and request.content_length > MAX_UPLOAD_BYTES:
+        return render_upload_page(status="File too large (max 20MB).", cls="warn", job_active=True)
 
-    name = safe_filename(f.filename)
+    # Stream the multipart body straight to a temp file in the job folder
+    # (werkzeug's form parser is CPU-bound on large binary uploads)
+    try:
+        parser = StreamingFormDataParser(headers=request.headers)
+    except ParseFailedException:
+        # not a multipart/form-data request
+        return render_upload_page(status="No file selected.", cls="warn", job_active=True)
+    tmp_path = Path(job_path) / f"{UPLOAD_TMP_PREFIX}{uuid.uuid4().hex}{UPLOAD_TMP_SUFFIX}"
+    target = UploadTarget(str(tmp_path))
+    parser.register("file", target)
+
+    received = 0
+    try:
+        while True:
+            chunk = request.stream.read(UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            received += len(chunk)
+            if received > MAX_UPLOAD_BYTES:
+                raise RequestEntityTooLarge()
+            parser.data_received(chunk)
+    except RequestEntityTooLarge:
+        discard_upload(target, tmp_path)
+        return render_upload_page(status="File too large (max 20MB).", cls="warn", job_active=True)
+    except ParseFailedException:
+        discard_upload(target, tmp_path)
+        return render_upload_page(status="Upload was incomplete or malformed. Please try again.", cls="warn", job_active=True)
+    except BaseException:
+        # real failure (disk full, permissions...): don't leave a partial file, surface the error
+        discard_upload(target, tmp_path)
+        raise
+
+    if target.multipart_filename is not None and not target.complete:
+        # body ended before the closing boundary: file is truncated (and still open)
+        discard_upload(target, tmp_path)
+        return render_upload_page(status="Upload was incomplete or malformed. Please try again.", cls="warn", job_active=True)
+    # always close before touching tmp_path (no-op if the part completed or never started)
+    target.finish()
+
+    if not target.multipart_filename:
+        basic_secure_delete_file(tmp_path)
+        return render_upload_page(status="No file selected.", cls="warn", job_active=True)
+
+    name = safe_filename(target.multipart_filename)
     if not is_allowed(name):
-        return render_template_string(UPLOAD_PAGE, status="File type not allowed.", cls="warn", job_active=True)
-
-    dest = Path(job_path) / name
-    # Prevent overwrite collisions
-    if dest.exists():
-        stem = dest.stem
-        ext = dest.suffix
-        dest = Path(job_path) / f"{stem}_{int(time.time())}{ext}"
+        basic_secure_delete_file(tmp_path)
+        return render_upload_page(status="File type not allowed.", cls="warn", job_active=True)
 
-    f.save(dest)
-    return render_template_string(UPLOAD_PAGE, status=f"Uploaded: {dest.name}", cls="ok", job_active=True)
+    try:
+        dest = claim_upload_path(Path(job_path), name)
+        tmp_path.replace(dest)
+    except OSError:
+        basic_secure_delete_file(tmp_path)
+        raise
+    with _current_job_files_lock:
+        # job may have ended while this upload was in flight; rmtree sweeps it then
+        if _current_job_path == job_path:
+            _current_job_files.append(dest)
+    return render_upload_page(status=f"Uploaded: {dest.name}", cls="ok", job_active=True)
+
+@flask_app.get("/qr.png")
+def qr_png():
+    # QR for the upload page (written by the UI at startup), e.g. to share the link
+    if not QR_FILE.exists():
+        abort(404)
+    return send_from_directory(QR_DIR, QR_FILE.name, mimetype="image/png")
 
 def run_server():
     # host 0.0.0.0 so phone can reach it
-    flask_app.run(host="0.0.0.0", port=SERVER_PORT, debug=False, use_reloader=False)
+    # Prefer waitress (multi-threaded WSGI) so one slow upload doesn't block other requests
+    try:
+        from waitress import serve
+    except ImportError:
+        flask_app.run(host="0.0.0.0", port=SERVER_PORT, debug=False, use_reloader=False, threaded=True)
+        return
+    # waitress buffers the whole request body before calling the app and spools
+    # anything over inbuf_overflow to the system temp dir, which would leave
+    # unwiped copies of customer files outside the job folder. Keep bodies in
+    # memory instead and cap them at MAX_UPLOAD_BYTES, the same whole-body limit
+    # Flask and upload() enforce; memory use is bounded by
+    # connection_limit x MAX_UPLOAD_BYTES.
+    serve(
+        flask_app,
+        host="0.0.0.0",
+        port=SERVER_PORT,
+        threads=SERVER_THREADS,
+        connection_limit=SERVER_CONNECTION_LIMIT,
+        max_request_body_size=MAX_UPLOAD_BYTES,
+        inbuf_overflow=MAX_UPLOAD_BYTES,
+    )
 
 # =========================
 # Tkinter UI
@@ -240,24 +512,30 @@ class SecurePrintUI:
         self.root = root
         self.root.title(APP_NAME)
         self.root.geometry("760x460")
+        # wipes run on background threads; don't let the window close under them
+        self._workers = []
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         ensure_dirs()
-        cleaned = cleanup_leftover_jobs()
 
         self.server_thread = None
         self.server_running = False
 
         self.current_job_id = None
         self.current_job_path = None
+        self._last_names = []  # names currently shown in the listbox (sorted)
         self.ip = get_local_ip()
         self.upload_url = f"http://{self.ip}:{SERVER_PORT}/"
 
+        # Filled in by _load_qr once the window is up (qrcode/Pillow load lazily)
+        self._qr_imgtk = tk.PhotoImage(width=220, height=220)
+
         # UI Layout
         top = ttk.Frame(root, padding=12)
         top.pack(fill="x")
 
         self.status_var = tk.StringVar()
-        self.status_var.set(f"Startup: cleaned {cleaned} leftover job(s).")
+        self.status_var.set("Startup: cleaning leftover jobs...")
 
         ttk.Label(top, text="SecurePrint Box (MVP)", font=("Segoe UI", 16, "bold")).pack(anchor="w")
         ttk.Label(top, textvariable=self.status_var).pack(anchor="w", pady=(4, 0))
@@ -295,7 +573,8 @@ class SecurePrintUI:
         self.listbox.pack(fill="both", expand=True, pady=(6, 0))
 
         ttk.Label(right, text="Upload QR (Phone → PC):", font=("Segoe UI", 11, "bold")).pack(anchor="w")
-        self.qr_label = ttk.Label(right)
+        # one persistent Tk image for the whole session (attached once, never re-created)
+        self.qr_label = ttk.Label(right, image=self._qr_imgtk)
         self.qr_label.pack(pady=(8, 8))
 
         self.url_label = ttk.Label(right, text=self.upload_url, wraplength=220)
@@ -305,10 +584,23 @@ class SecurePrintUI:
         self.job_label.pack(anchor="w", pady=(10, 0))
 
         self._set_qr("Start a job to enable uploads.")
+        self.root.after_idle(self._load_qr)
 
         # Start server once
         self.start_server_if_needed()
 
+        # Zero-trust cleanup off the Tk thread so the window stays responsive
+        self._start_worker(self._startup_cleanup_worker)
+
+    def _startup_cleanup_worker(self):
+        cleaned = cleanup_leftover_jobs()
+        self._post_to_ui(lambda: self._startup_cleanup_done(cleaned))
+
+    def _startup_cleanup_done(self, cleaned: int):
+        # don't clobber the status of a job started meanwhile
+        if self.current_job_path is None:
+            self.status_var.set(f"Startup: cleaned {cleaned} leftover job(s). Ready for Start Job.")
+
     def start_server_if_needed(self):
         if self.server_running:
             return
@@ -317,13 +609,13 @@ class SecurePrintUI:
         self.server_running = True
         self.status_var.set("Server started. Ready for Start Job.")
 
+    def _load_qr(self):
+        # upload_url never changes, so build the QR image once and let Tk load the PNG natively
+        make_qr_image(self.upload_url).save(QR_FILE)
+        self._qr_imgtk.configure(file=str(QR_FILE))
+
     def _set_qr(self, caption: str):
-        # Generate QR for upload_url
-        img = qrcode.make(self.upload_url)
-        img = img.resize((220, 220))
-        self.qr_imgtk = ImageTk.PhotoImage(img)
-        self.qr_label.configure(image=self.qr_imgtk)
-        self.url_label.configure(text=self.upload_url)
+        # QR image is attached once in __init__; only the caption changes
         self.job_label.configure(text=caption)
 
     def start_job(self):
@@ -332,7 +624,8 @@ class SecurePrintUI:
         self.current_job_path.mkdir(parents=True, exist_ok=True)
         write_marker(self.current_job_path)
 
-        CURRENT_JOB_PATH["path"] = str(self.current_job_path)
+        take_current_job_files()
+        set_current_job_path(str(self.current_job_path))
 
         self.status_var.set(f"Job started: {self.current_job_id}")
         self._set_qr(f"Active Job: {self.current_job_id}\nUploads go to:\n{self.current_job_path}")
@@ -343,12 +636,30 @@ class SecurePrintUI:
         self.refresh_list()
 
     def refresh_list(self):
-        self.listbox.delete(0, tk.END)
-        if not self.current_job_path:
+        names = []
+        if self.current_job_path:
+            # skip .jobmeta and in-progress .upload_*.part files (real uploads may start with ".")
+            with os.scandir(self.current_job_path) as it:
+                names = [e.name for e in it
+                         if e.is_file() and e.name != ".jobmeta" and not is_upload_tmp(e.name)]
+            names.sort()
+        if names == self._last_names:
             return
-        for f in sorted(self.current_job_path.iterdir()):
-            if f.is_file() and f.name != ".jobmeta":
-                self.listbox.insert(tk.END, f.name)
+
+        # only touch the rows that changed (fewer Tk redraws, keeps selection)
+        keep = set(names)
+        shown = self._last_names
+        for i in range(len(shown) - 1, -1, -1):
+            if shown[i] not in keep:
+                self.listbox.delete(i)
+        shown = [n for n in shown if n in keep]
+        have = set(shown)
+        for name in names:
+            if name not in have:
+                i = bisect.bisect_left(shown, name)
+                self.listbox.insert(i, name)
+                shown.insert(i, name)
+        self._last_names = shown
 
     def open_selected(self):
         if not self.current_job_path:
@@ -381,23 +692,11 @@ class SecurePrintUI:
         job_path = self.current_job_path
 
         # disable uploads immediately
-        CURRENT_JOB_PATH["path"] = None
-
-        self.status_var.set(f"Wiping: {job_path.name} ...")
-        self.root.update_idletasks()
-
-        wipe_job_folder(job_path)
-
-        self.current_job_id = None
-        self.current_job_path = None
-
-        self.listbox.delete(0, tk.END)
-        self._set_qr("No active job. Start a job to enable uploads.")
-        self.status_var.set("Job wiped successfully. 0 files remaining.")
+        set_current_job_path(None)
+        files = take_current_job_files()
 
-        self.btn_refresh.configure(state="disabled")
-        self.btn_open.configure(state="disabled")
-        self.btn_end.configure(state="disabled")
+        self._start_wipe(f"Wiping: {job_path.name} ...", lambda: wipe_job_folder(job_path, files),
+                         "Job wiped successfully. 0 files remaining.")
 
     def emergency_clean(self):
         ans = messagebox.askyesno(APP_NAME, "Emergency Clean ALL jobs folder? (Wipes everything)")
@@ -405,21 +704,57 @@ class SecurePrintUI:
             return
 
         # disable uploads
-        CURRENT_JOB_PATH["path"] = None
-
-        self.status_var.set("Emergency cleaning all jobs...")
-        self.root.update_idletasks()
+        set_current_job_path(None)
 
-        if JOBS_DIR.exists():
-            for job in JOBS_DIR.iterdir():
-                if job.is_dir():
-                    wipe_job_folder(job)
+        self._start_wipe("Emergency cleaning all jobs...", wipe_all_jobs, "Emergency clean complete.")
 
+    def _start_wipe(self, status: str, wipe, done_status: str):
+        # Run the wipe off the Tk thread so the window stays responsive
         self.current_job_id = None
         self.current_job_path = None
         self.listbox.delete(0, tk.END)
+        self._last_names = []
+        self.status_var.set(status)
+        for btn in (self.btn_start, self.btn_refresh, self.btn_open, self.btn_end, self.btn_emergency):
+            btn.configure(state="disabled")
+
+        self._start_worker(self._wipe_worker, wipe, done_status)
+
+    def _wipe_worker(self, wipe, done_status: str):
+        status = done_status
+        try:
+            wipe()
+        except Exception as e:
+            # don't report success; the buttons are re-enabled either way
+            status = f"Wipe failed: {e}"
+        finally:
+            self._post_to_ui(lambda: self._wipe_done(status))
+
+    def _start_worker(self, target, *args):
+        # non-daemon: the interpreter waits for a running wipe instead of killing it on exit
+        t = threading.Thread(target=target, args=args)
+        self._workers = [w for w in self._workers if w.is_alive()]
+        self._workers.append(t)
+        t.start()
+
+    def _post_to_ui(self, callback):
+        # run callback on the Tk thread; the window may already be gone
+        try:
+            self.root.after(0, callback)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def on_close(self):
+        if any(w.is_alive() for w in self._workers):
+            messagebox.showwarning(APP_NAME, "Wipe in progress. Please wait until it finishes before closing.")
+            return
+        self.root.destroy()
+
+    def _wipe_done(self, done_status: str):
         self._set_qr("No active job. Start a job to enable uploads.")
-        self.status_var.set("Emergency clean complete.")
+        self.status_var.set(done_status)
+        self.btn_start.configure(state="normal")
+        self.btn_emergency.configure(state="normal")
         self.btn_refresh.configure(state="disabled")
         self.btn_open.configure(state="disabled")
         self.btn_end.configure(state="disabled")